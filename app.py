@@ -1,12 +1,32 @@
-from flask import Flask, render_template, request, jsonify, send_file
+from flask import Flask, render_template, request, jsonify, send_from_directory, Response, abort
+from flask.json.provider import DefaultJSONProvider
 import os
+import re
+import mimetypes
+import orjson
+import time
+import shutil
+import zipfile
+import hashlib
+import threading
+import queue
+from collections import OrderedDict
 import deepl
 from werkzeug.utils import secure_filename
+from werkzeug.security import safe_join
+from werkzeug.exceptions import BadRequest, HTTPException, RequestEntityTooLarge
+from werkzeug.middleware.proxy_fix import ProxyFix
 import tempfile
 from dotenv import load_dotenv
 import logging
 from datetime import datetime
-import uuid
+from urllib.parse import quote
+import secrets
+from functools import lru_cache
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from streaming_form_data import StreamingFormDataParser
+from streaming_form_data.parser import ParseFailedException
+from streaming_form_data.targets import BaseTarget, ValueTarget
 
 # Load environment variables from .env file
 load_dotenv()
@@ -15,20 +35,68 @@ load_dotenv()
 log_dir = 'logs'
 os.makedirs(log_dir, exist_ok=True)
 
+class DailyFileHandler(logging.FileHandler):
+    """Append each record to translator_YYYYMMDD.log for the day it was logged on"""
+    
+    def __init__(self, directory):
+        self.directory = directory
+        self.day = datetime.now().strftime('%Y%m%d')
+        super().__init__(self._path(), encoding='utf-8', delay=True)
+    
+    def _path(self):
+        return os.path.abspath(os.path.join(self.directory, f'translator_{self.day}.log'))
+    
+    def emit(self, record):
+        # Files are never renamed or deleted, so gunicorn workers can share them safely
+        day = datetime.fromtimestamp(record.created).strftime('%Y%m%d')
+        if day != self.day:
+            self.acquire()
+            try:
+                self.day = day
+                self.close()
+                self.baseFilename = self._path()
+            finally:
+                self.release()
+        super().emit(record)
+
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(levelname)s - %(message)s',
     handlers=[
-        logging.FileHandler(os.path.join(log_dir, f'translator_{datetime.now().strftime("%Y%m%d")}.log')),
+        DailyFileHandler(log_dir),
         logging.StreamHandler()
     ]
 )
 logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+class OrjsonProvider(DefaultJSONProvider):
+    """JSON provider that encodes responses with orjson instead of the stdlib json module"""
+    
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=self.default, option=orjson.OPT_SORT_KEYS).decode('utf-8')
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+    
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        body = orjson.dumps(obj, default=self.default, option=orjson.OPT_SORT_KEYS | orjson.OPT_APPEND_NEWLINE)
+        return self._app.response_class(body, mimetype=self.mimetype)
 
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
+# Trust one proxy hop (nginx) for the client address and scheme
+app.wsgi_app = ProxyFix(app.wsgi_app)
 app.config['MAX_CONTENT_LENGTH'] = 50 * 1024 * 1024  # 50MB max for batch uploads
-app.config['UPLOAD_FOLDER'] = 'uploads'
-app.config['OUTPUT_FOLDER'] = 'translated'
+# Resolved once against the working directory; send_from_directory would otherwise use app.root_path
+app.config['UPLOAD_FOLDER'] = os.path.abspath('uploads')
+app.config['OUTPUT_FOLDER'] = os.path.abspath('translated')
+# Parse multipart uploads straight to disk; set STREAMING_UPLOADS=false to use Werkzeug's parser
+app.config['STREAMING_UPLOADS'] = os.getenv('STREAMING_UPLOADS', 'true').lower() == 'true'
+# Hand downloads to a front-end proxy: an nginx internal location prefix, or X-Sendfile for Apache
+app.config['X_ACCEL_REDIRECT_PREFIX'] = os.getenv('X_ACCEL_REDIRECT_PREFIX', '')
+app.config['USE_X_SENDFILE'] = os.getenv('USE_X_SENDFILE', 'false').lower() == 'true'
 
 # Ensure folders exist
 os.makedirs(app.config['UPLOAD_FOLDER'], exist_ok=True)
@@ -38,12 +106,72 @@ os.makedirs(app.config['OUTPUT_FOLDER'], exist_ok=True)
 DEEPL_API_KEY = os.getenv('DEEPL_API_KEY', '')
 
 if not DEEPL_API_KEY:
-    logger.warning("DEEPL_API_KEY not set. Please create a .env file with your API key.")
-    print("⚠️  Warning: DEEPL_API_KEY not set. Please create a .env file with your API key.")
-    print("   See .env.example for the required format.")
+    logger.warning("DEEPL_API_KEY not set. Please create a .env file with your API key. See .env.example for the required format.")
+
+@lru_cache(maxsize=1)
+def get_translator():
+    """Return a shared DeepL client so requests reuse its HTTP connection pool"""
+    return deepl.Translator(DEEPL_API_KEY)
+
+# Build the client at import so gunicorn --preload creates it once before forking workers.
+# No connections are opened until the first request, so nothing is shared across processes.
+if DEEPL_API_KEY:
+    get_translator()
 
 # Supported file types for DeepL Document Translation
 ALLOWED_EXTENSIONS = {'pdf', 'docx', 'pptx', 'xlsx', 'txt', 'html'}
+_ALLOWED_RE = re.compile(r'\.(' + '|'.join(sorted(ALLOWED_EXTENSIONS)) + r')\Z', re.IGNORECASE)
+
+# Number of documents translated concurrently in a batch upload
+BATCH_WORKERS = int(os.getenv('BATCH_WORKERS', '6'))
+
+# DeepL's language lists rarely change, so cache the serialized /languages response
+LANGUAGES_CACHE_TTL = int(os.getenv('LANGUAGES_CACHE_TTL', '86400'))
+_languages_cache = {'body': None, 'expires': 0.0}
+
+# Recent text translations, keyed by a hash of (source, target, formality, text)
+TEXT_CACHE_SIZE = int(os.getenv('TEXT_CACHE_SIZE', '10000'))
+TEXT_CACHE_TTL = int(os.getenv('TEXT_CACHE_TTL', str(30 * 86400)))
+_text_cache = OrderedDict()
+_text_cache_lock = threading.Lock()
+
+# Concurrent /translate-text requests are grouped into a single DeepL call
+MICROBATCH_WINDOW_MS = float(os.getenv('MICROBATCH_WINDOW_MS', '5'))
+MICROBATCH_MAX = int(os.getenv('MICROBATCH_MAX', '50'))
+MICROBATCH_TIMEOUT = 120
+_text_queue = queue.Queue()
+_text_worker = None
+_text_worker_lock = threading.Lock()
+_text_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix='text-batch')
+# Errors that fail every request on the account, so retrying texts one by one cannot help
+ACCOUNT_WIDE_ERRORS = (deepl.AuthorizationException, deepl.QuotaExceededException, deepl.TooManyRequestsException)
+
+# Document status polling backs off from a quick first check to a slow steady rate
+DOCUMENT_POLL_INITIAL = 0.25
+DOCUMENT_POLL_FACTOR = 1.7
+DOCUMENT_POLL_MAX = 8.0
+
+# Translated documents are also kept under a name derived from their content hash,
+# languages and formality, so repeats are copied from a file no other upload can overwrite
+TRANSLATION_CACHE_FOLDER = os.path.join(app.config['UPLOAD_FOLDER'], 'translation_cache')
+TRANSLATION_CACHE_TTL = int(os.getenv('TRANSLATION_CACHE_TTL', str(7 * 86400)))
+os.makedirs(TRANSLATION_CACHE_FOLDER, exist_ok=True)
+
+# Batch manifests list each batch's outputs so they can be downloaded as one ZIP.
+# Stored as one file per batch so every gunicorn worker can read them.
+BATCH_MANIFEST_FOLDER = os.path.join(app.config['UPLOAD_FOLDER'], 'batches')
+BATCH_DOWNLOAD_TTL = int(os.getenv('BATCH_DOWNLOAD_TTL', '86400'))
+_BATCH_ID_RE = re.compile(r'[0-9a-f]{16}')
+os.makedirs(BATCH_MANIFEST_FOLDER, exist_ok=True)
+
+# Form fields read alongside uploaded documents
+UPLOAD_FORM_FIELDS = ('target_lang', 'source_lang', 'formality')
+
+# Chunk size used when streaming request bodies to disk
+UPLOAD_CHUNK_SIZE = 64 * 1024
+
+# Chunk size used when copying Werkzeug-parsed uploads to disk
+UPLOAD_COPY_CHUNK_SIZE = 1024 * 1024
 
 # Error messages for better UX
 ERROR_MESSAGES = {
@@ -55,13 +183,373 @@ ERROR_MESSAGES = {
     'no_text': 'No text provided. Please enter some text to translate.',
     'translation_failed': 'Translation failed. Please try again.',
     'file_not_found': 'Translated file not found. It may have been deleted.',
+    'batch_not_found': 'Batch not found. It may have expired.',
+    'malformed_upload': 'Upload was incomplete or malformed. Please try again.',
 }
 
 def allowed_file(filename):
-    return '.' in filename and filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
+    return bool(_ALLOWED_RE.search(filename))
 
 def get_file_extension(filename):
-    return filename.rsplit('.', 1)[1].lower() if '.' in filename else ''
+    """Return the lowercased extension of an allowed filename, or '' otherwise"""
+    match = _ALLOWED_RE.search(filename)
+    return match.group(1).lower() if match else ''
+
+def text_cache_key(text, source_lang, target_lang, formality):
+    """Return a compact content hash identifying a text translation request"""
+    prefix = f"{source_lang or ''}|{target_lang}|{formality}|".encode('utf-8')
+    return hashlib.blake2b(prefix + text.encode('utf-8'), digest_size=16).hexdigest()
+
+def text_cache_get(key):
+    """Return a cached text translation response, or None if missing or expired"""
+    with _text_cache_lock:
+        entry = _text_cache.get(key)
+        if entry is None:
+            return None
+        expires, payload = entry
+        if time.monotonic() >= expires:
+            del _text_cache[key]
+            return None
+        _text_cache.move_to_end(key)
+        return payload
+
+def text_cache_set(key, payload):
+    """Store a text translation response, evicting the least recently used entries"""
+    if TEXT_CACHE_SIZE <= 0:
+        return
+    with _text_cache_lock:
+        _text_cache[key] = (time.monotonic() + TEXT_CACHE_TTL, payload)
+        _text_cache.move_to_end(key)
+        while len(_text_cache) > TEXT_CACHE_SIZE:
+            _text_cache.popitem(last=False)
+
+def _call_translate_text(translator, text, source_lang, target_lang, formality):
+    return translator.translate_text(
+        text,
+        source_lang=source_lang if source_lang else None,
+        target_lang=target_lang,
+        formality=formality if formality != 'default' else None
+    )
+
+def _translate_text_group(translator, items):
+    """Translate queued texts sharing languages and formality in one DeepL call"""
+    _, source_lang, target_lang, formality, _ = items[0]
+    try:
+        results = _call_translate_text(
+            translator, [item[0] for item in items], source_lang, target_lang, formality
+        )
+    except Exception as e:
+        if len(items) == 1 or isinstance(e, ACCOUNT_WIDE_ERRORS):
+            for item in items:
+                item[4].set_exception(e)
+            return
+        
+        # One bad text should not fail the whole group, so retry each on its own
+        logger.warning("Text micro-batch of %d failed, retrying individually: %s", len(items), e)
+        for text, source_lang, target_lang, formality, future in items:
+            try:
+                future.set_result(_call_translate_text(translator, text, source_lang, target_lang, formality))
+            except Exception as item_error:
+                future.set_exception(item_error)
+        return
+    
+    for item, result in zip(items, results):
+        item[4].set_result(result)
+
+def _text_batch_worker():
+    """Collect queued texts for up to MICROBATCH_WINDOW_MS and dispatch them in groups"""
+    while True:
+        items = [_text_queue.get()]
+        translator = get_translator()
+        deadline = time.monotonic() + MICROBATCH_WINDOW_MS / 1000
+        while len(items) < MICROBATCH_MAX:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                items.append(_text_queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        
+        groups = {}
+        for item in items:
+            groups.setdefault(item[1:4], []).append(item)
+        for group in groups.values():
+            _text_executor.submit(_translate_text_group, translator, group)
+
+def translate_text_batched(text, source_lang, target_lang, formality):
+    """Queue a text for the micro-batching worker and wait for its DeepL result"""
+    global _text_worker
+    # Started lazily so the thread lives in the process that serves requests
+    with _text_worker_lock:
+        if _text_worker is None or not _text_worker.is_alive():
+            _text_worker = threading.Thread(target=_text_batch_worker, name='text-batcher', daemon=True)
+            _text_worker.start()
+    
+    future = Future()
+    _text_queue.put((text, source_lang, target_lang, formality, future))
+    return future.result(timeout=MICROBATCH_TIMEOUT)
+
+def _save_upload_path(filename):
+    """Create an empty temp file for an allowed upload, or return None to skip it"""
+    file_extension = get_file_extension(filename) if filename else ''
+    if not file_extension:
+        return None
+    with tempfile.NamedTemporaryFile(delete=False, suffix=f'.{file_extension}') as input_file:
+        return input_file.name
+
+class _UploadTarget(BaseTarget):
+    """Streaming target that writes every file part of a field to its own temp file"""
+    
+    def __init__(self, max_parts):
+        super().__init__()
+        self.uploads = []
+        self.max_parts = max_parts
+        self.too_many_parts = False
+        self._fd = None
+    
+    def on_start(self):
+        # Same cap as Werkzeug's max_form_parts, checked before any temp file is created
+        if self.max_parts is not None and len(self.uploads) >= self.max_parts:
+            self.too_many_parts = True
+            raise RequestEntityTooLarge('Too many files in one upload.')
+        path = _save_upload_path(self.multipart_filename or '')
+        self.uploads.append((self.multipart_filename or '', path))
+        self._fd = open(path, 'wb') if path else None
+    
+    def on_data_received(self, chunk):
+        if self._fd:
+            self._fd.write(chunk)
+    
+    def on_finish(self):
+        if self._fd:
+            self._fd.close()
+            self._fd = None
+
+def read_upload_form(file_field):
+    """Read form fields and uploaded files, writing each allowed file to a temp path.
+    
+    Returns (form, uploads) where uploads is a list of (original_filename, temp_path)
+    and temp_path is None for empty or disallowed files.
+    """
+    if not app.config['STREAMING_UPLOADS']:
+        uploads = []
+        for file in request.files.getlist(file_field):
+            input_path = _save_upload_path(file.filename)
+            if input_path:
+                with open(input_path, 'wb') as input_file:
+                    shutil.copyfileobj(file.stream, input_file, UPLOAD_COPY_CHUNK_SIZE)
+            uploads.append((file.filename, input_path))
+        return request.form, uploads
+    
+    if request.mimetype != 'multipart/form-data':
+        return {}, []
+    
+    parser = StreamingFormDataParser(headers={'Content-Type': request.content_type})
+    values = {name: ValueTarget() for name in UPLOAD_FORM_FIELDS}
+    for name, target in values.items():
+        parser.register(name, target)
+    upload_target = _UploadTarget(request.max_form_parts)
+    parser.register(file_field, upload_target)
+    
+    # The parser accepts a body cut off mid-file, so watch for the closing delimiter ourselves
+    ender = b'\r\n--' + request.mimetype_params.get('boundary', '').encode('latin-1') + b'--'
+    tail = b''
+    ended = False
+    try:
+        while True:
+            chunk = request.stream.read(UPLOAD_CHUNK_SIZE)
+            if not chunk:
+                break
+            parser.data_received(chunk)
+            window = tail + chunk
+            ended = ended or ender in window
+            tail = window[-len(ender):]
+        if not ended:
+            raise BadRequest(ERROR_MESSAGES['malformed_upload'])
+    except Exception as e:
+        upload_target.on_finish()
+        for _, input_path in upload_target.uploads:
+            if input_path and os.path.exists(input_path):
+                os.unlink(input_path)
+        if upload_target.too_many_parts and not isinstance(e, RequestEntityTooLarge):
+            raise RequestEntityTooLarge('Too many files in one upload.') from e
+        if isinstance(e, ParseFailedException):
+            raise BadRequest(ERROR_MESSAGES['malformed_upload']) from e
+        raise
+    
+    form = {name: target.value.decode('utf-8') for name, target in values.items() if target.value}
+    return form, upload_target.uploads
+
+def translate_document_file(translator, input_path, output_path, target_lang, source_lang, formality):
+    """Translate a document file with DeepL, polling its status with exponential backoff"""
+    with open(input_path, 'rb') as input_file:
+        handle = translator.translate_document_upload(
+            input_file,
+            target_lang=target_lang,
+            source_lang=source_lang if source_lang else None,
+            formality=formality if formality != 'default' else None
+        )
+    
+    try:
+        polls = 1
+        delay = DOCUMENT_POLL_INITIAL
+        status = translator.translate_document_get_status(handle)
+        while status.ok and not status.done:
+            time.sleep(delay)
+            delay = min(delay * DOCUMENT_POLL_FACTOR, DOCUMENT_POLL_MAX)
+            status = translator.translate_document_get_status(handle)
+            polls += 1
+        
+        logger.info("Document status polled %d times: %s (%s)", polls, os.path.basename(output_path), status)
+        
+        if not status.ok:
+            raise deepl.DocumentTranslationException(
+                f"Error occurred while translating document: {status.error_message or 'unknown error'}",
+                handle
+            )
+        
+        with open(output_path, 'wb') as output_file:
+            translator.translate_document_download(handle, output_file)
+    except deepl.DocumentTranslationException:
+        if os.path.exists(output_path):
+            os.unlink(output_path)
+        raise
+    except Exception as e:
+        if os.path.exists(output_path):
+            os.unlink(output_path)
+        raise deepl.DocumentTranslationException(str(e), handle) from e
+    
+    return status
+
+def split_upload_name(raw_filename):
+    """Return (secured filename, name without extension, lowercased extension) for an upload"""
+    filename = secure_filename(raw_filename)
+    name_without_ext, dot, file_extension = filename.rpartition('.')
+    if not dot:
+        return filename, filename, ''
+    return filename, name_without_ext, file_extension.lower()
+
+def build_output_filename(name_without_ext, file_extension, target_lang):
+    """Return the translated filename for an upload's base name, extension and target language"""
+    return f"{name_without_ext}_{target_lang}.{file_extension}"
+
+def file_digest(path):
+    """Return a BLAKE2b content hash of a file, read in chunks"""
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(UPLOAD_COPY_CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def sweep_expired_files(folder, ttl):
+    """Delete files in a folder that were last modified more than ttl seconds ago"""
+    cutoff = time.time() - ttl
+    for entry in os.scandir(folder):
+        try:
+            if entry.is_file() and entry.stat().st_mtime < cutoff:
+                os.unlink(entry.path)
+        except FileNotFoundError:
+            pass
+
+def translation_cache_path(key, file_extension):
+    """Return the content-addressed path that holds the translation for a batch item key"""
+    name = hashlib.blake2b(key.encode('utf-8'), digest_size=16).hexdigest()
+    return os.path.join(TRANSLATION_CACHE_FOLDER, f'{name}.{file_extension}')
+
+def _batch_result(filename, output_filename):
+    return {
+        'original_filename': filename,
+        'translated_filename': output_filename,
+        'download_url': f'/download/{output_filename}',
+        'success': True
+    }
+
+def _reuse_translation(cache_path, filename, output_filename):
+    """Copy a cached translation to the output name for an upload"""
+    shutil.copyfile(cache_path, os.path.join(app.config['OUTPUT_FOLDER'], output_filename))
+    # Keep frequently reused translations from expiring
+    os.utime(cache_path)
+    return _batch_result(filename, output_filename)
+
+def _translate_one(translator, input_path, filename, output_filename, cache_path, target_lang, source_lang, formality):
+    """Translate one saved batch file and return its result entry (runs in a worker thread)"""
+    # Translate into a private temp file, then publish it atomically under the cache name
+    fd, partial_path = tempfile.mkstemp(dir=TRANSLATION_CACHE_FOLDER, suffix='.part')
+    os.close(fd)
+    try:
+        translate_document_file(translator, input_path, partial_path, target_lang, source_lang, formality)
+        os.replace(partial_path, cache_path)
+    finally:
+        if os.path.exists(input_path):
+            os.unlink(input_path)
+        if os.path.exists(partial_path):
+            os.unlink(partial_path)
+    
+    return _reuse_translation(cache_path, filename, output_filename)
+
+def batch_manifest_save(output_filenames):
+    """Record a batch's translated files and return its batch ID"""
+    # Expired manifests are otherwise only removed when someone requests them
+    sweep_expired_files(BATCH_MANIFEST_FOLDER, BATCH_DOWNLOAD_TTL)
+    batch_id = secrets.token_hex(8)
+    with open(os.path.join(BATCH_MANIFEST_FOLDER, f'{batch_id}.json'), 'wb') as manifest:
+        manifest.write(orjson.dumps(output_filenames))
+    return batch_id
+
+def batch_manifest_get(batch_id):
+    """Return a batch's translated filenames, or None if unknown or expired"""
+    if not _BATCH_ID_RE.fullmatch(batch_id):
+        return None
+    manifest_path = os.path.join(BATCH_MANIFEST_FOLDER, f'{batch_id}.json')
+    try:
+        if time.time() - os.path.getmtime(manifest_path) > BATCH_DOWNLOAD_TTL:
+            os.unlink(manifest_path)
+            return None
+        with open(manifest_path, 'rb') as manifest:
+            return orjson.loads(manifest.read())
+    except FileNotFoundError:
+        return None
+
+class _ZipStreamBuffer:
+    """Write-only file object that collects ZIP output between generator yields"""
+    
+    def __init__(self):
+        self._chunks = []
+    
+    def write(self, data):
+        self._chunks.append(bytes(data))
+        return len(data)
+    
+    def flush(self):
+        pass
+    
+    def drain(self):
+        data = b''.join(self._chunks)
+        self._chunks = []
+        return data
+
+def stream_zip(paths):
+    """Yield a ZIP archive of the given files chunk by chunk, without building it in memory"""
+    buffer = _ZipStreamBuffer()
+    # Translated documents are already compressed, so store them as-is
+    with zipfile.ZipFile(buffer, 'w', compression=zipfile.ZIP_STORED) as archive:
+        for path in paths:
+            info = zipfile.ZipInfo.from_file(path, os.path.basename(path))
+            info.compress_type = zipfile.ZIP_STORED
+            with open(path, 'rb') as source, archive.open(info, 'w') as entry:
+                for chunk in iter(lambda: source.read(UPLOAD_COPY_CHUNK_SIZE), b''):
+                    entry.write(chunk)
+                    yield buffer.drain()
+            yield buffer.drain()
+    yield buffer.drain()
+
+@app.before_request
+def reject_oversized_request():
+    """Reject bodies over MAX_CONTENT_LENGTH from the header alone, before any of it is read"""
+    content_length = request.content_length
+    if content_length and content_length > app.config['MAX_CONTENT_LENGTH']:
+        abort(413)
 
 @app.route('/')
 def index():
@@ -85,26 +573,32 @@ def get_languages():
             logger.error("Languages request failed: API key not configured")
             return jsonify({'error': ERROR_MESSAGES['no_api_key']}), 500
         
-        translator = deepl.Translator(DEEPL_API_KEY)
-        
-        # Get source languages
-        source_languages = [
-            {'code': lang.code, 'name': lang.name}
-            for lang in translator.get_source_languages()
-        ]
-        
-        # Get target languages
-        target_languages = [
-            {'code': lang.code, 'name': lang.name}
-            for lang in translator.get_target_languages()
-        ]
-        
-        logger.info(f"Languages loaded: {len(source_languages)} source, {len(target_languages)} target")
+        if _languages_cache['body'] is None or time.monotonic() >= _languages_cache['expires']:
+            translator = get_translator()
+            
+            # Get source languages
+            source_languages = [
+                {'code': lang.code, 'name': lang.name}
+                for lang in translator.get_source_languages()
+            ]
+            
+            # Get target languages
+            target_languages = [
+                {'code': lang.code, 'name': lang.name}
+                for lang in translator.get_target_languages()
+            ]
+            
+            logger.info("Languages loaded: %d source, %d target", len(source_languages), len(target_languages))
+            
+            _languages_cache['body'] = orjson.dumps({
+                'source_languages': source_languages,
+                'target_languages': target_languages
+            })
+            _languages_cache['expires'] = time.monotonic() + LANGUAGES_CACHE_TTL
         
-        return jsonify({
-            'source_languages': source_languages,
-            'target_languages': target_languages
-        })
+        response = Response(_languages_cache['body'], mimetype='application/json')
+        response.headers['Cache-Control'] = f'public, max-age={LANGUAGES_CACHE_TTL}'
+        return response
     except deepl.AuthorizationException:
         logger.error("DeepL authorization failed - invalid API key")
         return jsonify({'error': 'Invalid DeepL API key. Please check your credentials.'}), 401
@@ -112,17 +606,17 @@ def get_languages():
         logger.error("DeepL quota exceeded")
         return jsonify({'error': 'DeepL API quota exceeded. Please check your plan limits.'}), 429
     except Exception as e:
-        logger.error(f"Languages request failed: {str(e)}")
+        logger.error("Languages request failed: %s", e)
         return jsonify({'error': f'Failed to load languages: {str(e)}'}), 500
 
 @app.route('/translate-text', methods=['POST'])
 def translate_text():
     """Translate plain text using DeepL API"""
-    request_id = str(uuid.uuid4())[:8]
+    request_id = secrets.token_hex(4)
     
     try:
         if not DEEPL_API_KEY:
-            logger.error(f"[{request_id}] Text translation failed: API key not configured")
+            logger.error("[%s] Text translation failed: API key not configured", request_id)
             return jsonify({'error': ERROR_MESSAGES['no_api_key']}), 500
         
         data = request.get_json()
@@ -132,97 +626,90 @@ def translate_text():
         formality = data.get('formality', 'default')
         
         if not text:
-            logger.warning(f"[{request_id}] Text translation failed: No text provided")
+            logger.warning("[%s] Text translation failed: No text provided", request_id)
             return jsonify({'error': ERROR_MESSAGES['no_text']}), 400
         
         char_count = len(text)
-        logger.info(f"[{request_id}] Text translation started: {char_count} chars, target={target_lang}")
+        logger.info("[%s] Text translation started: %d chars, target=%s", request_id, char_count, target_lang)
         
-        translator = deepl.Translator(DEEPL_API_KEY)
+        cache_key = text_cache_key(text, source_lang, target_lang, formality)
+        cached = text_cache_get(cache_key)
+        if cached is not None:
+            logger.info("[%s] Text translation served from cache", request_id)
+            return jsonify(cached)
         
-        result = translator.translate_text(
-            text,
-            source_lang=source_lang if source_lang else None,
-            target_lang=target_lang,
-            formality=formality if formality != 'default' else None
-        )
+        result = translate_text_batched(text, source_lang, target_lang, formality)
         
-        logger.info(f"[{request_id}] Text translation completed: {source_lang or result.detected_source_lang} → {target_lang}")
+        logger.info("[%s] Text translation completed: %s → %s", request_id, source_lang or result.detected_source_lang, target_lang)
         
-        return jsonify({
+        payload = {
             'success': True,
             'translated_text': result.text,
             'detected_source_lang': result.detected_source_lang,
             'character_count': char_count
-        })
+        }
+        text_cache_set(cache_key, payload)
+        
+        return jsonify(payload)
     
     except deepl.AuthorizationException:
-        logger.error(f"[{request_id}] DeepL authorization failed")
+        logger.error("[%s] DeepL authorization failed", request_id)
         return jsonify({'error': 'Invalid DeepL API key. Please check your credentials.'}), 401
     except deepl.QuotaExceededException:
-        logger.error(f"[{request_id}] DeepL quota exceeded")
+        logger.error("[%s] DeepL quota exceeded", request_id)
         return jsonify({'error': 'DeepL API quota exceeded. Please upgrade your plan or wait for quota reset.'}), 429
+    except deepl.TooManyRequestsException:
+        logger.error("[%s] DeepL rate limit reached", request_id)
+        return jsonify({'error': 'Too many requests to DeepL. Please try again shortly.'}), 429
     except Exception as e:
-        logger.error(f"[{request_id}] Text translation failed: {str(e)}")
+        logger.error("[%s] Text translation failed: %s", request_id, e)
         return jsonify({'error': f'Translation failed: {str(e)}'}), 500
 
 @app.route('/upload', methods=['POST'])
 def upload_document():
     """Translate a single document using DeepL Document API"""
-    request_id = str(uuid.uuid4())[:8]
+    request_id = secrets.token_hex(4)
     
     try:
         if not DEEPL_API_KEY:
-            logger.error(f"[{request_id}] Document upload failed: API key not configured")
+            logger.error("[%s] Document upload failed: API key not configured", request_id)
             return jsonify({'error': ERROR_MESSAGES['no_api_key']}), 500
         
-        if 'file' not in request.files:
-            logger.warning(f"[{request_id}] Document upload failed: No file provided")
+        form, uploads = read_upload_form('file')
+        
+        if not uploads:
+            logger.warning("[%s] Document upload failed: No file provided", request_id)
             return jsonify({'error': ERROR_MESSAGES['no_file']}), 400
         
-        file = request.files['file']
+        original_filename, input_path = uploads[0]
+        for _, extra_path in uploads[1:]:
+            if extra_path:
+                os.unlink(extra_path)
         
-        if file.filename == '':
-            logger.warning(f"[{request_id}] Document upload failed: No file selected")
+        if original_filename == '':
+            logger.warning("[%s] Document upload failed: No file selected", request_id)
             return jsonify({'error': ERROR_MESSAGES['no_file_selected']}), 400
         
-        if not allowed_file(file.filename):
-            logger.warning(f"[{request_id}] Document upload failed: Invalid file type - {file.filename}")
+        if not allowed_file(original_filename):
+            logger.warning("[%s] Document upload failed: Invalid file type - %s", request_id, original_filename)
             return jsonify({'error': ERROR_MESSAGES['invalid_file_type']}), 400
         
-        target_lang = request.form.get('target_lang', 'EN-US')
-        source_lang = request.form.get('source_lang', None)
-        formality = request.form.get('formality', 'default')
-        
-        filename = secure_filename(file.filename)
-        file_extension = get_file_extension(filename)
-        
-        logger.info(f"[{request_id}] Document translation started: {filename}, target={target_lang}")
+        target_lang = form.get('target_lang', 'EN-US')
+        source_lang = form.get('source_lang', None)
+        formality = form.get('formality', 'default')
         
-        # Create temp file for input
-        with tempfile.NamedTemporaryFile(delete=False, suffix=f'.{file_extension}') as input_file:
-            file.save(input_file.name)
-            input_path = input_file.name
-        
-        # Create output filename
-        name_without_ext = filename.rsplit('.', 1)[0]
-        output_filename = f"{name_without_ext}_{target_lang}.{file_extension}"
+        filename, name_without_ext, file_extension = split_upload_name(original_filename)
+        output_filename = build_output_filename(name_without_ext, file_extension, target_lang)
         output_path = os.path.join(app.config['OUTPUT_FOLDER'], output_filename)
         
+        logger.info("[%s] Document translation started: %s, target=%s", request_id, filename, target_lang)
+        
         try:
-            translator = deepl.Translator(DEEPL_API_KEY)
-            
-            translator.translate_document_from_filepath(
-                input_path,
-                output_path,
-                target_lang=target_lang,
-                source_lang=source_lang if source_lang else None,
-                formality=formality if formality != 'default' else None
-            )
+            translator = get_translator()
             
-            os.unlink(input_path)
+            translate_document_file(translator, input_path, output_path, target_lang, source_lang, formality)
             
-            logger.info(f"[{request_id}] Document translation completed: {filename} → {output_filename}")
+            logger.info("[%s] Document translation completed: %s → %s", request_id, filename, output_filename)
             
             return jsonify({
                 'success': True,
@@ -233,112 +720,156 @@ def upload_document():
             })
             
         except deepl.DocumentTranslationException as e:
+            logger.error("[%s] Document translation failed: %s", request_id, e)
+            raise Exception(f"Document translation failed: {str(e)}")
+        finally:
             if os.path.exists(input_path):
                 os.unlink(input_path)
-            logger.error(f"[{request_id}] Document translation failed: {str(e)}")
-            raise Exception(f"Document translation failed: {str(e)}")
     
     except deepl.AuthorizationException:
-        logger.error(f"[{request_id}] DeepL authorization failed")
+        logger.error("[%s] DeepL authorization failed", request_id)
         return jsonify({'error': 'Invalid DeepL API key. Please check your credentials.'}), 401
     except deepl.QuotaExceededException:
-        logger.error(f"[{request_id}] DeepL quota exceeded")
+        logger.error("[%s] DeepL quota exceeded", request_id)
         return jsonify({'error': 'DeepL API quota exceeded. Document translation requires more quota.'}), 429
+    except HTTPException:
+        raise
     except Exception as e:
-        logger.error(f"[{request_id}] Document upload failed: {str(e)}")
+        logger.error("[%s] Document upload failed: %s", request_id, e)
         return jsonify({'error': str(e)}), 500
 
 @app.route('/upload-batch', methods=['POST'])
 def upload_batch():
     """Translate multiple documents at once"""
-    request_id = str(uuid.uuid4())[:8]
+    request_id = secrets.token_hex(4)
     
     try:
         if not DEEPL_API_KEY:
-            logger.error(f"[{request_id}] Batch upload failed: API key not configured")
+            logger.error("[%s] Batch upload failed: API key not configured", request_id)
             return jsonify({'error': ERROR_MESSAGES['no_api_key']}), 500
         
-        if 'files[]' not in request.files:
-            logger.warning(f"[{request_id}] Batch upload failed: No files provided")
-            return jsonify({'error': ERROR_MESSAGES['no_file']}), 400
-        
-        files = request.files.getlist('files[]')
+        form, files = read_upload_form('files[]')
         
-        if not files or len(files) == 0:
-            return jsonify({'error': ERROR_MESSAGES['no_file_selected']}), 400
+        if not files:
+            logger.warning("[%s] Batch upload failed: No files provided", request_id)
+            return jsonify({'error': ERROR_MESSAGES['no_file']}), 400
         
-        target_lang = request.form.get('target_lang', 'EN-US')
-        source_lang = request.form.get('source_lang', None)
-        formality = request.form.get('formality', 'default')
+        target_lang = form.get('target_lang', 'EN-US')
+        source_lang = form.get('source_lang', None)
+        formality = form.get('formality', 'default')
         
-        logger.info(f"[{request_id}] Batch translation started: {len(files)} files, target={target_lang}")
+        logger.info("[%s] Batch translation started: %d files, target=%s", request_id, len(files), target_lang)
         
-        translator = deepl.Translator(DEEPL_API_KEY)
+        translator = get_translator()
         results = []
         successful = 0
         failed = 0
         
-        for file in files:
-            if file.filename == '':
+        # Uploads are already on disk, so workers only need the temp paths
+        prepared = []
+        for original_filename, input_path in files:
+            if original_filename == '':
                 continue
             
-            if not allowed_file(file.filename):
+            if not allowed_file(original_filename):
                 results.append({
-                    'original_filename': file.filename,
+                    'original_filename': original_filename,
                     'success': False,
                     'error': 'Invalid file type'
                 })
                 failed += 1
                 continue
             
-            filename = secure_filename(file.filename)
-            file_extension = get_file_extension(filename)
+            filename, name_without_ext, file_extension = split_upload_name(original_filename)
+            output_filename = build_output_filename(name_without_ext, file_extension, target_lang)
+            prepared.append((len(results), filename, output_filename, input_path))
+            results.append(None)
+        
+        # Identical documents are translated once; duplicates and repeats of earlier
+        # uploads are copied from the content-addressed translation cache
+        sweep_expired_files(TRANSLATION_CACHE_FOLDER, TRANSLATION_CACHE_TTL)
+        batch_keys = {}
+        duplicates = []
+        pending = []
+        for index, filename, output_filename, input_path in prepared:
+            # DeepL handles each format differently, so identical bytes only match within one extension
+            file_extension = get_file_extension(output_filename)
+            key = f"{file_digest(input_path)}|{file_extension}|{target_lang}|{source_lang or ''}|{formality}"
+            cache_path = translation_cache_path(key, file_extension)
             
-            try:
-                with tempfile.NamedTemporaryFile(delete=False, suffix=f'.{file_extension}') as input_file:
-                    file.save(input_file.name)
-                    input_path = input_file.name
-                
-                name_without_ext = filename.rsplit('.', 1)[0]
-                output_filename = f"{name_without_ext}_{target_lang}.{file_extension}"
-                output_path = os.path.join(app.config['OUTPUT_FOLDER'], output_filename)
-                
-                translator.translate_document_from_filepath(
-                    input_path,
-                    output_path,
-                    target_lang=target_lang,
-                    source_lang=source_lang if source_lang else None,
-                    formality=formality if formality != 'default' else None
-                )
-                
+            if key in batch_keys:
                 os.unlink(input_path)
-                
-                results.append({
-                    'original_filename': filename,
-                    'translated_filename': output_filename,
-                    'download_url': f'/download/{output_filename}',
-                    'success': True
-                })
+                duplicates.append((index, filename, output_filename, cache_path, batch_keys[key]))
+                continue
+            batch_keys[key] = index
+            
+            if os.path.exists(cache_path):
+                try:
+                    results[index] = _reuse_translation(cache_path, filename, output_filename)
+                except OSError as e:
+                    logger.warning("[%s] Cached translation unavailable, translating again: %s - %s", request_id, filename, e)
+                else:
+                    os.unlink(input_path)
+                    successful += 1
+                    logger.info("[%s] Batch item reused earlier translation: %s", request_id, filename)
+                    continue
+            
+            pending.append((index, filename, output_filename, input_path, cache_path))
+        
+        # DeepL document translation is I/O-bound, so translate the files concurrently
+        with ThreadPoolExecutor(max_workers=BATCH_WORKERS) as executor:
+            futures = {
+                executor.submit(
+                    _translate_one, translator, input_path, filename, output_filename,
+                    cache_path, target_lang, source_lang, formality
+                ): (index, filename)
+                for index, filename, output_filename, input_path, cache_path in pending
+            }
+            
+            for future in as_completed(futures):
+                index, filename = futures[future]
+                try:
+                    results[index] = future.result()
+                    successful += 1
+                    logger.info("[%s] Batch item completed: %s", request_id, filename)
+                except Exception as e:
+                    results[index] = {
+                        'original_filename': filename,
+                        'success': False,
+                        'error': str(e)
+                    }
+                    failed += 1
+                    logger.error("[%s] Batch item failed: %s - %s", request_id, filename, e)
+        
+        for index, filename, output_filename, cache_path, first_index in duplicates:
+            first = results[first_index]
+            try:
+                if not first['success']:
+                    raise Exception(first['error'])
+                results[index] = _reuse_translation(cache_path, filename, output_filename)
                 successful += 1
-                logger.info(f"[{request_id}] Batch item completed: {filename}")
-                
+                logger.info("[%s] Batch item duplicated %s: %s", request_id, first['original_filename'], filename)
             except Exception as e:
-                if 'input_path' in locals() and os.path.exists(input_path):
-                    os.unlink(input_path)
-                results.append({
+                results[index] = {
                     'original_filename': filename,
                     'success': False,
                     'error': str(e)
-                })
+                }
                 failed += 1
-                logger.error(f"[{request_id}] Batch item failed: {filename} - {str(e)}")
         
-        logger.info(f"[{request_id}] Batch translation completed: {successful} successful, {failed} failed")
+        logger.info("[%s] Batch translation completed: %d successful, %d failed", request_id, successful, failed)
+        
+        output_filenames = list(dict.fromkeys(
+            result['translated_filename'] for result in results if result['success']
+        ))
+        batch_id = batch_manifest_save(output_filenames) if output_filenames else None
         
         return jsonify({
             'success': failed == 0,
             'message': f'Translated {successful} of {successful + failed} files',
             'results': results,
+            'batch_id': batch_id,
+            'download_all_url': f'/download-batch/{batch_id}' if batch_id else None,
             'summary': {
                 'total': successful + failed,
                 'successful': successful,
@@ -347,36 +878,87 @@ def upload_batch():
         })
     
     except deepl.AuthorizationException:
-        logger.error(f"[{request_id}] DeepL authorization failed")
+        logger.error("[%s] DeepL authorization failed", request_id)
         return jsonify({'error': 'Invalid DeepL API key. Please check your credentials.'}), 401
     except deepl.QuotaExceededException:
-        logger.error(f"[{request_id}] DeepL quota exceeded")
+        logger.error("[%s] DeepL quota exceeded", request_id)
         return jsonify({'error': 'DeepL API quota exceeded. Try with fewer files.'}), 429
+    except HTTPException:
+        raise
     except Exception as e:
-        logger.error(f"[{request_id}] Batch upload failed: {str(e)}")
+        logger.error("[%s] Batch upload failed: %s", request_id, e)
         return jsonify({'error': str(e)}), 500
 
 @app.route('/download/<filename>')
 def download_file(filename):
     """Download the translated document"""
     try:
-        file_path = os.path.join(app.config['OUTPUT_FOLDER'], secure_filename(filename))
+        # Only files that exist directly inside the output folder can be served
+        file_path = safe_join(app.config['OUTPUT_FOLDER'], filename)
         
-        if not os.path.exists(file_path):
-            logger.warning(f"Download failed: File not found - {filename}")
+        if file_path is None or not os.path.isfile(file_path):
+            logger.warning("Download failed: File not found - %s", filename)
             return jsonify({'error': ERROR_MESSAGES['file_not_found']}), 404
         
-        logger.info(f"File downloaded: {filename}")
+        logger.info("File downloaded: %s", filename)
+        
+        if app.config['X_ACCEL_REDIRECT_PREFIX']:
+            # nginx streams the file itself; we only send headers
+            response = Response(mimetype=mimetypes.guess_type(filename)[0] or 'application/octet-stream')
+            response.headers['X-Accel-Redirect'] = app.config['X_ACCEL_REDIRECT_PREFIX'] + quote(filename)
+            response.headers['Content-Disposition'] = f'attachment; filename="{filename}"'
+            return response
         
-        return send_file(
-            file_path,
+        # Conditional responses let repeat downloads revalidate to a 304 and support Range requests
+        return send_from_directory(
+            app.config['OUTPUT_FOLDER'],
+            filename,
             as_attachment=True,
-            download_name=filename
+            download_name=filename,
+            conditional=True,
+            etag=True,
+            max_age=0
+        )
+    except Exception as e:
+        logger.error("Download failed: %s", e)
+        return jsonify({'error': f'Download failed: {str(e)}'}), 500
+
+@app.route('/download-batch/<batch_id>')
+def download_batch(batch_id):
+    """Download every translated document in a batch as one ZIP archive"""
+    try:
+        output_filenames = batch_manifest_get(batch_id)
+        
+        if output_filenames is None:
+            logger.warning("Batch download failed: Batch not found - %s", batch_id)
+            return jsonify({'error': ERROR_MESSAGES['batch_not_found']}), 404
+        
+        paths = [
+            os.path.join(app.config['OUTPUT_FOLDER'], output_filename)
+            for output_filename in output_filenames
+        ]
+        paths = [path for path in paths if os.path.exists(path)]
+        
+        if not paths:
+            logger.warning("Batch download failed: No files left - %s", batch_id)
+            return jsonify({'error': ERROR_MESSAGES['file_not_found']}), 404
+        
+        logger.info("Batch downloaded: %s (%d files)", batch_id, len(paths))
+        
+        return Response(
+            stream_zip(paths),
+            mimetype='application/zip',
+            headers={'Content-Disposition': f'attachment; filename="translated_{batch_id}.zip"'}
         )
     except Exception as e:
-        logger.error(f"Download failed: {str(e)}")
+        logger.error("Batch download failed: %s", e)
         return jsonify({'error': f'Download failed: {str(e)}'}), 500
 
+@app.errorhandler(400)
+def bad_request(error):
+    logger.warning("Request rejected: %s", error.description)
+    return jsonify({'error': error.description}), 400
+
 @app.errorhandler(413)
 def request_entity_too_large(error):
     logger.warning("Upload rejected: File too large")
@@ -384,9 +966,12 @@ def request_entity_too_large(error):
 
 @app.errorhandler(500)
 def internal_server_error(error):
-    logger.error(f"Internal server error: {str(error)}")
+    logger.error("Internal server error: %s", error)
     return jsonify({'error': 'An unexpected error occurred. Please try again.'}), 500
 
+# Local development server only; production runs under gunicorn (see Dockerfile)
 if __name__ == '__main__':
-    logger.info("Document Translator started on http://127.0.0.1:5000")
-    app.run(debug=True, port=5000)
+    # The debugger and reloader are only enabled with FLASK_ENV=development
+    debug = os.getenv('FLASK_ENV') == 'development'
+    logger.info("Document Translator started on http://127.0.0.1:5000 (debug=%s)", debug)
+    app.run(debug=debug, port=5000)
@@ -0,0 +1,89 @@
+import io
+import os
+import sys
+import tempfile
+import threading
+import types
+
+import pytest
+
+# app.py creates its logs/uploads/translated folders relative to the working directory
+os.environ['DEEPL_API_KEY'] = 'test-key'
+os.chdir(tempfile.mkdtemp(prefix='translator-tests-'))
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import app as app_module  # noqa: E402
+
+
+class FakeTranslator:
+    """Stand-in for deepl.Translator that "translates" by reversing bytes or uppercasing text"""
+
+    def __init__(self):
+        self.calls = []
+        self._lock = threading.Lock()
+        self.text_error = None
+
+    def _record(self, *call):
+        with self._lock:
+            self.calls.append(call)
+
+    def translate_text(self, text, source_lang=None, target_lang=None, formality=None):
+        self._record('text', text, target_lang)
+        if self.text_error:
+            self.text_error(text)
+        if isinstance(text, list):
+            return [types.SimpleNamespace(text=t.upper(), detected_source_lang='EN') for t in text]
+        return types.SimpleNamespace(text=text.upper(), detected_source_lang='EN')
+
+    def translate_document_upload(self, input_file, target_lang=None, source_lang=None, formality=None):
+        data = input_file.read()
+        self._record('document', data, target_lang)
+        return types.SimpleNamespace(data=data)
+
+    def translate_document_get_status(self, handle):
+        return types.SimpleNamespace(ok=True, done=True, error_message=None)
+
+    def translate_document_download(self, handle, output_file):
+        output_file.write(handle.data[::-1])
+
+    def get_source_languages(self):
+        self._record('languages', 'source')
+        return [types.SimpleNamespace(code='EN', name='English')]
+
+    def get_target_languages(self):
+        self._record('languages', 'target')
+        return [types.SimpleNamespace(code='DE', name='German')]
+
+    def calls_of(self, kind):
+        return [call for call in self.calls if call[0] == kind]
+
+
+@pytest.fixture(autouse=True)
+def translation_cache(tmp_path_factory, monkeypatch):
+    """Give every test an empty translation cache so earlier uploads are not reused"""
+    folder = tmp_path_factory.mktemp('translation_cache')
+    monkeypatch.setattr(app_module, 'TRANSLATION_CACHE_FOLDER', str(folder))
+    return folder
+
+
+@pytest.fixture
+def translator(monkeypatch):
+    fake = FakeTranslator()
+    monkeypatch.setattr(app_module, 'get_translator', lambda: fake)
+    return fake
+
+
+@pytest.fixture
+def client(translator):
+    return app_module.app.test_client()
+
+
+@pytest.fixture
+def upload_batch(client):
+    """Post (filename, content) pairs to /upload-batch and return the JSON body of the 200 response"""
+    def upload(*files, target_lang='DE'):
+        data = {'target_lang': target_lang, 'files[]': [(io.BytesIO(content), name) for name, content in files]}
+        response = client.post('/upload-batch', data=data, content_type='multipart/form-data')
+        assert response.status_code == 200
+        return response.get_json()
+    return upload
@@ -0,0 +1,73 @@
+import os
+
+import app
+
+
+def _translated(filename):
+    with open(os.path.join(app.app.config['OUTPUT_FOLDER'], filename), 'rb') as f:
+        return f.read()
+
+
+def test_same_name_uploads_reuse_their_own_translation(upload_batch, translator):
+    upload_batch(('report.txt', b'first document'), ('report.txt', b'second document'))
+    assert len(translator.calls_of('document')) == 2
+
+    # Both items wrote report_DE.txt; the first document must still get its own translation back
+    body = upload_batch(('report.txt', b'first document'))
+
+    assert body['summary'] == {'total': 1, 'successful': 1, 'failed': 0}
+    assert len(translator.calls_of('document')) == 2
+    assert _translated(body['results'][0]['translated_filename']) == b'tnemucod tsrif'
+
+
+def test_duplicates_in_one_batch_are_translated_once(upload_batch, translator):
+    body = upload_batch(('a.txt', b'same bytes'), ('b.txt', b'same bytes'))
+
+    assert body['summary'] == {'total': 2, 'successful': 2, 'failed': 0}
+    assert translator.calls_of('document') == [('document', b'same bytes', 'DE')]
+    assert _translated('a_DE.txt') == _translated('b_DE.txt') == b'setyb emas'
+
+
+def test_same_bytes_with_different_extensions_are_translated_separately(upload_batch, translator):
+    body = upload_batch(('a.txt', b'<p>same</p>'), ('b.html', b'<p>same</p>'))
+
+    assert body['summary'] == {'total': 2, 'successful': 2, 'failed': 0}
+    assert len(translator.calls_of('document')) == 2
+    assert _translated('a_DE.txt') == _translated('b_DE.html') == b'>p/<emas>p<'
+
+
+def test_failed_reuse_is_reported_per_item(upload_batch, translator, monkeypatch):
+    def missing(cache_path, filename, output_filename):
+        raise FileNotFoundError(cache_path)
+
+    monkeypatch.setattr(app, '_reuse_translation', missing)
+    body = upload_batch(('a.txt', b'same bytes'), ('b.txt', b'same bytes'))
+
+    assert body['summary'] == {'total': 2, 'successful': 0, 'failed': 2}
+    assert all(not result['success'] for result in body['results'])
+
+
+def test_unreadable_cache_entry_is_translated_again(upload_batch, translator, monkeypatch):
+    upload_batch(('a.txt', b'cached bytes'))
+    copyfile = app.shutil.copyfile
+    failures = [OSError('cache entry unreadable')]
+
+    def flaky_copyfile(src, dst):
+        if failures:
+            raise failures.pop()
+        return copyfile(src, dst)
+
+    monkeypatch.setattr(app.shutil, 'copyfile', flaky_copyfile)
+    body = upload_batch(('a.txt', b'cached bytes'))
+
+    assert body['summary']['successful'] == 1
+    assert len(translator.calls_of('document')) == 2
+
+
+def test_expired_cache_entries_are_swept(upload_batch, translator, translation_cache, monkeypatch):
+    upload_batch(('a.txt', b'old bytes'))
+    monkeypatch.setattr(app, 'TRANSLATION_CACHE_TTL', -1)
+
+    upload_batch(('b.txt', b'new bytes'))
+
+    assert len(os.listdir(translation_cache)) == 1
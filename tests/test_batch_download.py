@@ -0,0 +1,25 @@
+import io
+import os
+import zipfile
+
+import app
+
+
+def test_download_all_returns_zip_of_batch(client, upload_batch, translator):
+    body = upload_batch(('one.txt', b'zip one'), ('two.txt', b'zip two'))
+
+    response = client.get(body['download_all_url'])
+
+    assert response.status_code == 200
+    with zipfile.ZipFile(io.BytesIO(response.data)) as archive:
+        assert sorted(archive.namelist()) == ['one_DE.txt', 'two_DE.txt']
+        assert archive.read('one_DE.txt') == b'eno piz'
+
+
+def test_expired_manifests_are_swept_on_save(upload_batch, translator, monkeypatch):
+    first = upload_batch(('old.txt', b'old batch'))
+    monkeypatch.setattr(app, 'BATCH_DOWNLOAD_TTL', -1)
+
+    upload_batch(('new.txt', b'new batch'))
+
+    assert f"{first['batch_id']}.json" not in os.listdir(app.BATCH_MANIFEST_FOLDER)
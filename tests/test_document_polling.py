@@ -0,0 +1,79 @@
+import types
+
+import deepl
+import pytest
+
+import app
+from conftest import FakeTranslator
+
+
+class SlowTranslator(FakeTranslator):
+    """Reports a document as in progress for a few polls, then returns the given final status"""
+
+    def __init__(self, pending_polls, final_status):
+        super().__init__()
+        self.pending_polls = pending_polls
+        self.final_status = final_status
+        self.polls = 0
+
+    def translate_document_get_status(self, handle):
+        self.polls += 1
+        if self.polls <= self.pending_polls:
+            return types.SimpleNamespace(ok=True, done=False, error_message=None)
+        return self.final_status
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    delays = []
+    monkeypatch.setattr(app.time, 'sleep', delays.append)
+    return delays
+
+
+@pytest.fixture
+def paths(tmp_path):
+    input_path = tmp_path / 'input.txt'
+    input_path.write_bytes(b'document')
+    return input_path, tmp_path / 'output.txt'
+
+
+def test_polls_with_exponential_backoff_until_done(paths, sleeps, monkeypatch):
+    monkeypatch.setattr(app, 'DOCUMENT_POLL_MAX', 0.5)
+    done = types.SimpleNamespace(ok=True, done=True, error_message=None)
+    translator = SlowTranslator(4, done)
+    input_path, output_path = paths
+
+    status = app.translate_document_file(translator, input_path, output_path, 'DE', None, 'default')
+
+    assert status is done
+    assert translator.polls == 5
+    assert sleeps == pytest.approx([0.25, 0.425, 0.5, 0.5])
+    assert output_path.read_bytes() == b'tnemucod'
+
+
+def test_failed_status_raises_and_leaves_no_output(paths, sleeps):
+    failed = types.SimpleNamespace(ok=False, done=False, error_message='unsupported layout')
+    translator = SlowTranslator(3, failed)
+    input_path, output_path = paths
+
+    with pytest.raises(deepl.DocumentTranslationException, match='unsupported layout'):
+        app.translate_document_file(translator, input_path, output_path, 'DE', None, 'default')
+
+    assert translator.polls == 4
+    assert len(sleeps) == 3
+    assert not output_path.exists()
+
+
+def test_interrupted_download_is_wrapped_and_partial_output_removed(paths, sleeps):
+    class BrokenDownload(FakeTranslator):
+        def translate_document_download(self, handle, output_file):
+            output_file.write(b'partial')
+            raise ConnectionError('connection reset')
+
+    input_path, output_path = paths
+
+    with pytest.raises(deepl.DocumentTranslationException, match='connection reset') as excinfo:
+        app.translate_document_file(BrokenDownload(), input_path, output_path, 'DE', None, 'default')
+
+    assert isinstance(excinfo.value.__cause__, ConnectionError)
+    assert not output_path.exists()
@@ -0,0 +1,56 @@
+import os
+
+import app
+
+
+def _write_output(filename, content):
+    with open(os.path.join(app.app.config['OUTPUT_FOLDER'], filename), 'wb') as f:
+        f.write(content)
+
+
+def test_download_serves_translated_file(client):
+    _write_output('download_DE.txt', b'translated text')
+
+    response = client.get('/download/download_DE.txt')
+
+    assert response.status_code == 200
+    assert response.data == b'translated text'
+    assert 'attachment' in response.headers['Content-Disposition']
+    assert response.headers['ETag']
+
+
+def test_download_revalidates_with_etag(client):
+    _write_output('etag_DE.txt', b'etag body')
+    etag = client.get('/download/etag_DE.txt').headers['ETag']
+
+    response = client.get('/download/etag_DE.txt', headers={'If-None-Match': etag})
+
+    assert response.status_code == 304
+    assert response.data == b''
+
+
+def test_download_supports_range_requests(client):
+    _write_output('range_DE.txt', b'0123456789')
+
+    response = client.get('/download/range_DE.txt', headers={'Range': 'bytes=2-5'})
+
+    assert response.status_code == 206
+    assert response.data == b'2345'
+    assert response.headers['Content-Range'] == 'bytes 2-5/10'
+
+
+def test_download_rejects_paths_outside_output_folder(client):
+    with open(os.path.join(app.app.config['UPLOAD_FOLDER'], 'secret.txt'), 'wb') as f:
+        f.write(b'secret')
+
+    assert client.get('/download/..%2Fuploads%2Fsecret.txt').status_code == 404
+    with app.app.test_request_context():
+        _, status = app.download_file('../uploads/secret.txt')
+    assert status == 404
+
+
+def test_download_missing_file_returns_json_404(client):
+    response = client.get('/download/missing_DE.txt')
+
+    assert response.status_code == 404
+    assert response.get_json()['error'] == app.ERROR_MESSAGES['file_not_found']
@@ -0,0 +1,19 @@
+import pytest
+
+import app
+
+
+@pytest.mark.parametrize('filename, extension', [
+    ('report.pdf', 'pdf'),
+    ('Slides.PPTX', 'pptx'),
+    ('archive.tar.txt', 'txt'),
+])
+def test_allowed_extensions(filename, extension):
+    assert app.allowed_file(filename)
+    assert app.get_file_extension(filename) == extension
+
+
+@pytest.mark.parametrize('filename', ['a.pdf\n', 'a.pdf.exe', 'pdf', 'a.pdfx', ''])
+def test_rejected_filenames(filename):
+    assert not app.allowed_file(filename)
+    assert app.get_file_extension(filename) == ''
@@ -0,0 +1,39 @@
+import pytest
+
+import app
+
+
+@pytest.fixture(autouse=True)
+def empty_cache(monkeypatch):
+    monkeypatch.setitem(app._languages_cache, 'body', None)
+    monkeypatch.setitem(app._languages_cache, 'expires', 0.0)
+
+
+def test_languages_fetched_once_per_ttl(client, translator):
+    first = client.get('/languages')
+    second = client.get('/languages')
+
+    assert first.status_code == second.status_code == 200
+    assert second.get_json() == {
+        'source_languages': [{'code': 'EN', 'name': 'English'}],
+        'target_languages': [{'code': 'DE', 'name': 'German'}],
+    }
+    assert len(translator.calls_of('languages')) == 2
+
+
+def test_languages_refetched_after_ttl(client, translator, monkeypatch):
+    monkeypatch.setattr(app, 'LANGUAGES_CACHE_TTL', 0)
+
+    client.get('/languages')
+    client.get('/languages')
+
+    assert len(translator.calls_of('languages')) == 4
+
+
+def test_languages_response_is_cacheable(client, translator, monkeypatch):
+    monkeypatch.setattr(app, 'LANGUAGES_CACHE_TTL', 3600)
+
+    response = client.get('/languages')
+
+    assert response.headers['Cache-Control'] == 'public, max-age=3600'
+    assert response.mimetype == 'application/json'
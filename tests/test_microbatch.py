@@ -0,0 +1,68 @@
+import threading
+
+import deepl
+import pytest
+
+import app
+
+
+@pytest.fixture
+def wide_window(monkeypatch):
+    """Hold the batching window open long enough for concurrent requests to share it"""
+    monkeypatch.setattr(app, 'MICROBATCH_WINDOW_MS', 200)
+
+
+def _translate_concurrently(client, payloads):
+    responses = [None] * len(payloads)
+
+    def post(index, payload):
+        responses[index] = client.post('/translate-text', json=payload)
+
+    threads = [threading.Thread(target=post, args=item) for item in enumerate(payloads)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return responses
+
+
+def _payloads(prefix, count, target_lang='DE'):
+    return [{'text': f'{prefix} {i}', 'target_lang': target_lang} for i in range(count)]
+
+
+def test_concurrent_texts_share_one_call_per_language(client, translator, wide_window):
+    payloads = _payloads('fan', 3) + _payloads('fan', 2, target_lang='FR')
+    responses = _translate_concurrently(client, payloads)
+
+    assert [r.get_json()['translated_text'] for r in responses] == [p['text'].upper() for p in payloads]
+    calls = translator.calls_of('text')
+    assert sorted((len(call[1]), call[2]) for call in calls) == [(2, 'FR'), (3, 'DE')]
+
+
+def test_failed_group_retries_each_text(client, translator, wide_window):
+    def reject_bad(text):
+        if isinstance(text, list) or text == 'retry bad':
+            raise deepl.DeepLException('bad text')
+
+    translator.text_error = reject_bad
+    responses = _translate_concurrently(client, [{'text': t, 'target_lang': 'DE'} for t in ('retry ok', 'retry bad')])
+
+    assert responses[0].status_code == 200
+    assert responses[0].get_json()['translated_text'] == 'RETRY OK'
+    assert responses[1].status_code == 500
+
+
+@pytest.mark.parametrize('error, status', [
+    (deepl.QuotaExceededException('quota'), 429),
+    (deepl.TooManyRequestsException('slow down'), 429),
+    (deepl.AuthorizationException('bad key'), 401),
+])
+def test_account_wide_error_fails_group_without_retries(client, translator, wide_window, error, status):
+    def fail(text):
+        raise error
+
+    translator.text_error = fail
+    responses = _translate_concurrently(client, _payloads(f'account {status} {type(error).__name__}', 3))
+
+    assert [r.status_code for r in responses] == [status] * 3
+    assert len(translator.calls_of('text')) == 1
@@ -0,0 +1,42 @@
+import orjson
+from werkzeug.test import create_environ, run_wsgi_app
+
+import app
+
+
+class RecordingBody:
+    """Empty wsgi.input that remembers whether the app tried to read it"""
+
+    def __init__(self):
+        self.read_called = False
+
+    def read(self, *args):
+        self.read_called = True
+        return b''
+
+    readline = read
+
+
+def _post(path, content_length):
+    environ = create_environ(path, method='POST', content_type='multipart/form-data; boundary=x')
+    # Set through the raw environ because the test client rewrites Content-Length from the body
+    environ['CONTENT_LENGTH'] = str(content_length)
+    environ['wsgi.input'] = stream = RecordingBody()
+    body, status, headers = run_wsgi_app(app.app.wsgi_app, environ, buffered=True)
+    return status, b''.join(body), stream.read_called
+
+
+def test_oversized_content_length_rejected_before_reading(translator):
+    status, body, read_called = _post('/upload-batch', app.app.config['MAX_CONTENT_LENGTH'] + 1)
+
+    assert status.startswith('413')
+    assert not read_called
+    assert 'too large' in orjson.loads(body)['error']
+    assert translator.calls == []
+
+
+def test_content_length_at_limit_is_read(translator):
+    status, _, read_called = _post('/upload-batch', app.app.config['MAX_CONTENT_LENGTH'])
+
+    assert not status.startswith('413')
+    assert read_called
@@ -0,0 +1,100 @@
+import io
+import os
+import tempfile
+
+import pytest
+
+import app
+
+
+@pytest.fixture
+def temp_dir(tmp_path, monkeypatch):
+    """Route upload temp files into an isolated directory so leaks are visible"""
+    monkeypatch.setattr(tempfile, 'tempdir', str(tmp_path))
+    return tmp_path
+
+
+def _batch(count, name='doc{}.txt'):
+    return {
+        'target_lang': 'DE',
+        'files[]': [(io.BytesIO(b'content %d' % i), name.format(i)) for i in range(count)],
+    }
+
+
+def test_streaming_batch_translates_and_removes_temp_files(client, translator, temp_dir):
+    response = client.post('/upload-batch', data=_batch(3), content_type='multipart/form-data')
+
+    assert response.status_code == 200
+    assert response.get_json()['summary'] == {'total': 3, 'successful': 3, 'failed': 0}
+    assert len(translator.calls_of('document')) == 3
+    assert os.listdir(temp_dir) == []
+
+
+def test_streaming_reads_form_fields(client, translator, temp_dir):
+    data = {'file': (io.BytesIO(b'hello'), 'note.txt'), 'target_lang': 'FR'}
+    response = client.post('/upload', data=data, content_type='multipart/form-data')
+
+    assert response.status_code == 200
+    assert response.get_json()['translated_filename'] == 'note_FR.txt'
+    assert translator.calls_of('document') == [('document', b'hello', 'FR')]
+
+
+def test_disallowed_files_never_reach_disk(client, translator, temp_dir):
+    data = {'target_lang': 'DE', 'files[]': [(io.BytesIO(b'x'), 'tool.exe')]}
+    response = client.post('/upload-batch', data=data, content_type='multipart/form-data')
+
+    assert response.get_json()['results'][0]['error'] == 'Invalid file type'
+    assert translator.calls_of('document') == []
+    assert os.listdir(temp_dir) == []
+
+
+@pytest.mark.parametrize('streaming', [True, False])
+def test_too_many_parts_rejected_and_cleaned_up(client, translator, temp_dir, monkeypatch, streaming):
+    monkeypatch.setitem(app.app.config, 'STREAMING_UPLOADS', streaming)
+    monkeypatch.setattr(app.app.request_class, 'max_form_parts', 3)
+
+    response = client.post('/upload-batch', data=_batch(5), content_type='multipart/form-data')
+
+    assert response.status_code == 413
+    assert translator.calls_of('document') == []
+    assert os.listdir(temp_dir) == []
+
+
+def _raw_post(client, body):
+    return client.post('/upload-batch', data=body, content_type='multipart/form-data; boundary=x')
+
+
+def test_malformed_body_is_rejected_as_bad_request(client, translator, temp_dir):
+    response = _raw_post(client, b'not a multipart body')
+
+    assert response.status_code == 400
+    assert response.get_json()['error'] == app.ERROR_MESSAGES['malformed_upload']
+    assert translator.calls_of('document') == []
+
+
+def test_truncated_body_is_rejected_and_cleaned_up(client, translator, temp_dir):
+    body = (
+        b'--x\r\nContent-Disposition: form-data; name="target_lang"\r\n\r\nDE\r\n'
+        b'--x\r\nContent-Disposition: form-data; name="files[]"; filename="a.txt"\r\n'
+        b'Content-Type: text/plain\r\n\r\nabc'
+    )
+    response = _raw_post(client, body)
+
+    assert response.status_code == 400
+    assert translator.calls_of('document') == []
+    assert os.listdir(temp_dir) == []
+
+
+@pytest.mark.parametrize('chunk_size', [3, 65536])
+def test_complete_raw_body_is_accepted(client, translator, temp_dir, monkeypatch, chunk_size):
+    # Small chunks split the closing delimiter across reads
+    monkeypatch.setattr(app, 'UPLOAD_CHUNK_SIZE', chunk_size)
+    body = (
+        b'--x\r\nContent-Disposition: form-data; name="target_lang"\r\n\r\nDE\r\n'
+        b'--x\r\nContent-Disposition: form-data; name="files[]"; filename="a.txt"\r\n'
+        b'Content-Type: text/plain\r\n\r\nabc\r\n--x--\r\n'
+    )
+    response = _raw_post(client, body)
+
+    assert response.status_code == 200
+    assert translator.calls_of('document') == [('document', b'abc', 'DE')]
@@ -0,0 +1,58 @@
+from collections import OrderedDict
+
+import pytest
+
+import app
+
+
+@pytest.fixture(autouse=True)
+def empty_cache(monkeypatch):
+    monkeypatch.setattr(app, '_text_cache', OrderedDict())
+
+
+def _translate(client, text):
+    response = client.post('/translate-text', json={'text': text, 'target_lang': 'DE'})
+    assert response.status_code == 200
+    return response.get_json()
+
+
+def test_repeated_text_is_served_from_cache(client, translator):
+    first = _translate(client, 'cache hit')
+    second = _translate(client, 'cache hit')
+
+    assert second == first
+    assert len(translator.calls_of('text')) == 1
+
+
+def test_expired_entries_are_translated_again(client, translator, monkeypatch):
+    monkeypatch.setattr(app, 'TEXT_CACHE_TTL', 0)
+
+    _translate(client, 'cache expiry')
+    _translate(client, 'cache expiry')
+
+    assert len(translator.calls_of('text')) == 2
+
+
+def test_least_recently_used_entry_is_evicted(client, translator, monkeypatch):
+    monkeypatch.setattr(app, 'TEXT_CACHE_SIZE', 2)
+
+    _translate(client, 'lru one')
+    _translate(client, 'lru two')
+    _translate(client, 'lru one')
+    _translate(client, 'lru three')
+    assert len(translator.calls_of('text')) == 3
+
+    _translate(client, 'lru one')
+    assert len(translator.calls_of('text')) == 3
+    _translate(client, 'lru two')
+    assert len(translator.calls_of('text')) == 4
+
+
+def test_zero_size_disables_cache(client, translator, monkeypatch):
+    monkeypatch.setattr(app, 'TEXT_CACHE_SIZE', 0)
+
+    _translate(client, 'cache off')
+    _translate(client, 'cache off')
+
+    assert len(translator.calls_of('text')) == 2
+    assert len(app._text_cache) == 0